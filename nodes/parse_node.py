@@ -2,18 +2,301 @@
 ParseNode Module
 """
 
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse, uses_netloc, uses_relative
 
 from langchain_community.document_transformers import Html2TextTransformer
 from langchain_core.documents import Document
+from lxml import etree
+from lxml import html as lxml_html
 
 from ..helpers import default_filters
+from ..utils import get_logger
 from ..utils.split_text_into_chunks import split_text_into_chunks
 from .base_node import BaseNode
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Every URL-bearing attribute we harvest, collected in a single tree walk.
+_URL_ATTRS_XPATH = etree.XPath(
+    "//a/@href"
+    " | //img/@src | //img/@data-src | //img/@srcset | //img/@data-srcset"
+    " | //source/@src | //source/@data-src | //source/@srcset | //source/@data-srcset"
+)
+# <template> is matched too: its content is re-parsed (see _iter_lexbor_url_attrs)
+_URL_ATTRS_CSS = "a[href], img, source, template"
+# A serialised <template ...> start tag; lexbor always double-quotes attributes
+_TEMPLATE_START_RE = re.compile(r'<template(?:[^>"]|"[^"]*")*>')
+_MEDIA_URL_ATTRS = ("src", "data-src", "srcset", "data-srcset")
+# Lower-case image extensions without the leading dot, for O(1) lookups.
+_IMG_EXT_SET = frozenset(
+    ext.lstrip(".").lower() for ext in default_filters.filter_dict["img_exts"]
+)
+_ABS_URL_RE = re.compile(r"https?://[^\s)\"'<>]+", re.I)
+_MD_REL_RE = re.compile(r"\]\(([^)]+)\)")
+# Leading markdown debris such as "[text](" or ")[" left in front of a URL.
+# Applied one after another, in this order: a nested image-link like
+# "[![img](a.png)](https://x.com)" relies on "](" being stripped first.
+_CLEAN_JUNK_RES = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r".*?\]\(",
+        r".*?\[\(",
+        r".*?\[\)",
+        r".*?\]\)",
+        r".*?\)\[",
+        r".*?\)\[",
+        r".*?\(\]",
+        r".*?\)\]",
+    )
+)
+# Document lists longer than this are parsed on a thread pool.  lexbor and
+# lxml both release the GIL while parsing, but lxml only runs in parallel
+# when each thread has its own parser (see _thread_html_parser).
+_PARALLEL_PARSE_MIN_DOCS = 4
+# Per-thread lxml parsers, keyed by forced encoding (None for the default)
+_thread_parsers = threading.local()
+
+
+def _compile_linear(pattern: str):
+    """
+    Compiles *pattern* with RE2 (linear-time, no backtracking) when available,
+    falling back to the standard library engine.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _thread_html_parser(encoding: Optional[str] = None) -> lxml_html.HTMLParser:
+    """
+    Returns the calling thread's lxml HTML parser for *encoding*.
+
+    A shared parser instance serialises every parse on its own lock, so each
+    worker thread gets a parser of its own.
+    """
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        # huge_tree lifts libxml2's depth-256 / 10 MB text-node limits, past
+        # which it silently stops parsing (unclosed <font>/<div> tag soup)
+        parser = parsers[encoding] = lxml_html.HTMLParser(
+            encoding=encoding, huge_tree=True
+        )
+    return parser
+
+
+def _iter_url_attrs(text: str):
+    """
+    Yields ``(attribute, value)`` for every URL-bearing attribute in *text*.
+
+    Uses selectolax's lexbor parser when installed, otherwise lxml.
+
+    Example:
+        >>> html = '<a href="/x">' + "<font>" * 300 + '<img src="/late.png">'
+        >>> [value for _, value in _iter_url_attrs(html)]
+        ['/x', '/late.png']
+    """
+    if LexborHTMLParser is not None:
+        yield from _iter_lexbor_url_attrs(text)
+    else:
+        try:
+            tree = lxml_html.fromstring(text, parser=_thread_html_parser())
+        except ValueError:
+            # lxml rejects str input carrying an XML encoding declaration
+            # (common on XHTML pages); the text is already decoded, so parse
+            # it as UTF-8 bytes with a parser that ignores the declaration.
+            tree = lxml_html.fromstring(
+                text.encode("utf-8"), parser=_thread_html_parser("utf-8")
+            )
+        for value in _URL_ATTRS_XPATH(tree):
+            yield value.attrname, value
+
+
+def _iter_lexbor_url_attrs(text: str):
+    """
+    Yields ``(attribute, value)`` pairs from *text* using selectolax's lexbor.
+
+    lexbor keeps <template> content in a separate document fragment that
+    ``css()`` never reaches, whereas lxml treats it as ordinary children.  To
+    return the same URLs on both backends, each template's serialised content
+    is parsed again in place, which also covers nested templates.
+    """
+    for node in LexborHTMLParser(text).css(_URL_ATTRS_CSS):
+        tag = node.tag
+        if tag == "template":
+            markup = node.html
+            start = _TEMPLATE_START_RE.match(markup)
+            if start is not None and markup.endswith("</template>"):
+                content = markup[start.end() : -len("</template>")]
+                if content:
+                    yield from _iter_lexbor_url_attrs(content)
+            continue
+
+        attrs = node.attributes
+        for attr in ("href",) if tag == "a" else _MEDIA_URL_ATTRS:
+            value = attrs.get(attr)
+            if value:
+                yield attr, value
+
+
+@lru_cache(maxsize=128)
+def _extract_urls_cached(
+    text: str,
+    source: str,
+    verbose: bool = False,
+    sort_urls: bool = False,
+    is_markdown: bool = True,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Returns the (links, images) detected in *text* as tuples.
+
+    Extraction is deterministic for a given (text, source), so results are
+    memoised to skip re-parsing when a graph re-runs ParseNode on the same
+    document (e.g. after an LLM retry).
+
+    The strategy is:
+    1.  Parse the string as HTML (selectolax if available, else lxml) and
+        collect every <a href> and <img>/<source> *src* / *data-src* /
+        *srcset* in a single pass.
+    2.  Run a regex pass to catch any http(s) links that are present in
+        markdown or plain text.
+    3.  Run a regex pass for the markdown relative-link syntax `](path)` so
+        we don't miss images that were converted to markdown by html2text.
+        Skipped when *is_markdown* is False, i.e. *text* is raw HTML.
+    4.  Normalise every URL – convert relative paths to absolute using the
+        original *source* page, strip whitespace, drop empty and hash-only
+        anchors, and split off query-strings when checking the extension.
+
+    URLs are returned in first-seen order, or sorted when *sort_urls* is set.
+    """
+
+    # dicts rather than sets: de-duplicated *and* insertion-ordered
+    links: dict[str, None] = {}
+    images: dict[str, None] = {}
+
+    # Raw candidate strings, de-duplicated before the (costlier) categorisation
+    candidates: dict[str, None] = {}
+
+    # Root-relative paths ("/img/a.png") only need the source origin prepended.
+    # Only for schemes urljoin resolves against (http, https, ftp, ...); for
+    # others such as s3:// it leaves the relative URL untouched.
+    parsed_source = urlparse(source) if source else None
+    if (
+        parsed_source
+        and parsed_source.scheme in uses_relative
+        and parsed_source.scheme in uses_netloc
+        and parsed_source.netloc
+    ):
+        source_origin = f"{parsed_source.scheme}://{parsed_source.netloc}"
+    else:
+        source_origin = None
+
+    # Called once per distinct candidate URL: the default arguments bind the
+    # helpers as fast locals instead of global lookups on every call.
+    def _categorise(
+        url: str,
+        _urlparse=urlparse,
+        _urljoin=urljoin,
+        _img_exts=_IMG_EXT_SET,
+        _links=links,
+        _images=images,
+    ):
+        if not url or url in {"#", "/"}:
+            return
+
+        # Make absolute if needed. Root-relative paths skip urljoin unless it
+        # would rewrite them: dot segments are normalised and empty params,
+        # query or fragment ("/a;", "/a?", "/a#") are dropped.
+        # Scheme-relative "//host" and the rest still use it.
+        if (
+            source_origin is not None
+            and url[0] == "/"
+            and url[1:2] != "/"
+            and "/." not in url
+            and ";" not in url
+            and "?#" not in url
+            and not url.endswith(("?", "#"))
+        ):
+            url_abs = source_origin + url
+        elif not _urlparse(url).scheme:
+            url_abs = _urljoin(source, url)
+        else:
+            url_abs = url
+
+        # Decide image vs link
+        # partition() returns a tuple, avoiding split()'s list allocations
+        url_no_query = url_abs.partition("?")[0].partition("#")[0]
+        _, dot, ext = url_no_query.rpartition(".")
+        # Without a dot there is no extension (e.g. a bare "png" path)
+        if dot and ext.lower() in _img_exts:
+            _images[url_abs] = None
+        else:
+            _links[url_abs] = None
+
+    # 1. HTML parser on HTML content (may gracefully handle plain text)
+    try:
+        # <a href>, <img>/<source> src + common lazy-loading attributes
+        for attr, value in _iter_url_attrs(text):
+            if attr.endswith("set"):
+                # srcset can hold multiple URLs
+                for part in value.split(","):
+                    part = part.split()
+                    if part:
+                        candidates[part[0]] = None
+            else:
+                candidates[value.strip()] = None
+    except Exception as e:
+        if verbose:
+            get_logger().warning(f"HTML parsing failed in _extract_urls: {e}")
+
+    # 2. Regex pass for absolute http(s) URLs in markdown/plain-text
+    for match in _ABS_URL_RE.findall(text):
+        candidates[match] = None
+
+    # 3. Regex pass for markdown relative links/images: ![alt](path) or [txt](path)
+    if is_markdown:
+        for match in _MD_REL_RE.findall(text):
+            # Ignore titles inside the same parens – take only the first token
+            parts = match.split()
+            if parts:
+                candidates[parts[0]] = None
+
+    # 4. Normalise and categorise each distinct candidate once
+    for url in candidates:
+        _categorise(url)
+
+    # Image vs link depends only on the URL, so the two never overlap.
+    if sort_urls:
+        return tuple(sorted(links)), tuple(sorted(images))
+    return tuple(links), tuple(images)
+
+
+@lru_cache(maxsize=None)
+def _html2text_transformer() -> Html2TextTransformer:
+    """
+    Returns a shared Html2TextTransformer; it keeps no per-document state.
+    """
+    return Html2TextTransformer(ignore_links=False)
+
 
 class ParseNode(BaseNode):
     """
@@ -33,7 +316,7 @@ class ParseNode(BaseNode):
         node_name (str): The unique identifier name for the node, defaulting to "Parse".
     """
 
-    url_pattern = re.compile(
+    url_pattern = _compile_linear(
         r"[http[s]?:\/\/]?(www\.)?([-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b[-a-zA-Z0-9()@:%_\+.~#?&\/\/=]*)"
     )
     relative_url_pattern = re.compile(r"[\(](/[^\(\)\s]*)")
@@ -50,16 +333,63 @@ class ParseNode(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
-        self.parse_html = (
+        # Backing fields for the parse_html / parse_urls properties, assigned
+        # directly so the execute path is selected once both are known.
+        self._parse_html = (
             True if node_config is None else node_config.get("parse_html", True)
         )
-        self.parse_urls = (
+        self._parse_urls = (
             False if node_config is None else node_config.get("parse_urls", False)
         )
+        self.sort_urls = (
+            False if node_config is None else node_config.get("sort_urls", False)
+        )
+        self.skip_html2text = (
+            False if node_config is None else node_config.get("skip_html2text", False)
+        )
 
         self.llm_model = node_config.get("llm_model")
         self.chunk_size = node_config.get("chunk_size")
 
+        # Pick the execute path once instead of branching on every call
+        self._execute_impl = self._select_execute_impl()
+
+    @property
+    def parse_html(self) -> bool:
+        """
+        Whether the input is raw HTML to be converted before chunking.
+        """
+        return self._parse_html
+
+    @parse_html.setter
+    def parse_html(self, value: bool):
+        self._parse_html = value
+        self._execute_impl = self._select_execute_impl()
+
+    @property
+    def parse_urls(self) -> bool:
+        """
+        Whether link and image URLs are extracted into the output state.
+        """
+        return self._parse_urls
+
+    @parse_urls.setter
+    def parse_urls(self, value: bool):
+        self._parse_urls = value
+        self._execute_impl = self._select_execute_impl()
+
+    def _select_execute_impl(self) -> str:
+        """
+        Returns the name of the execute specialisation matching the node's
+        parsing flags.  The name is resolved on the instance at call time, so
+        subclass overrides apply and copies of the node dispatch on themselves.
+        """
+        if self._parse_html:
+            if self._parse_urls:
+                return "_execute_html_urls"
+            return "_execute_html"
+        return "_execute_raw"
+
     def execute(self, state: dict) -> dict:
         """
         Executes the node's logic to parse the HTML document content and split it into chunks.
@@ -78,155 +408,159 @@ class ParseNode(BaseNode):
 
         self.logger.info(f"--- Executing {self.node_name} Node ---")
 
+        return getattr(self, self._execute_impl)(state)
+
+    def _execute_html_urls(self, state: dict) -> dict:
+        """
+        Specialisation for ``parse_html`` and ``parse_urls``: harvests URLs
+        from the raw HTML, then converts and chunks the document.
+        """
         input_keys = self.get_input_keys(state)
-        input_data = [state[key] for key in input_keys]
-        docs_transformed = input_data[0]
-        source = input_data[1] if self.parse_urls else None
-
-        if self.parse_html:
-            # ----------------------------------------
-            # 1.  Run URL extraction on *raw HTML* to keep <img> tags intact.
-            #     html2text can strip/remove image elements, which prevents us
-            #     from ever seeing those URLs later.  Using the untouched HTML
-            #     guarantees every <img>/<a> reference is available.
-            # ----------------------------------------
-            raw_docs = input_data[0]
-            # Handle both single-Document and list-of-Document cases
-            if isinstance(raw_docs, list):
-                raw_html = "\n".join(doc.page_content for doc in raw_docs)
-            else:
-                raw_html = raw_docs.page_content
+        raw_docs = state[input_keys[0]]
+        source = state[input_keys[1]]
+
+        link_urls, img_urls = self._extract_doc_urls(raw_docs, source)
+        chunks = self._chunk_html(raw_docs)
+
+        state.update(
+            {
+                self.output[0]: chunks,
+                "parsed_doc": chunks,
+                "content": chunks,
+                self.output[1]: link_urls,
+                self.output[2]: img_urls,
+            }
+        )
 
-            link_urls, img_urls = self._extract_urls(raw_html, source)
+        return state
 
-            # ----------------------------------------
-            # 2.  Convert HTML → markdown/plain-text for chunking so that the
-            #     LLM gets cleaner text, *after* we've harvested URLs.
-            # ----------------------------------------
-            docs_transformed = Html2TextTransformer(ignore_links=False).transform_documents(raw_docs)
-            if isinstance(docs_transformed, list):
-                docs_transformed = docs_transformed[0]
+    def _execute_html(self, state: dict) -> dict:
+        """
+        Specialisation for ``parse_html`` alone: converts and chunks the
+        document without any URL extraction.
+        """
+        input_keys = self.get_input_keys(state)
+        chunks = self._chunk_html(state[input_keys[0]])
 
-            chunks = split_text_into_chunks(
-                text=docs_transformed.page_content,
-                chunk_size=self.chunk_size - 250,
-            )
-        else:
-            docs_transformed = docs_transformed[0]
+        state.update(
+            {self.output[0]: chunks, "parsed_doc": chunks, "content": chunks}
+        )
+
+        return state
+
+    def _execute_raw(self, state: dict) -> dict:
+        """
+        Specialisation for ``parse_html=False``: chunks the already-converted
+        document as-is, extracting URLs from it if *parse_urls* is set.
+        """
+        input_keys = self.get_input_keys(state)
+        docs_transformed = state[input_keys[0]][0]
 
+        if self.parse_urls:
+            source = state[input_keys[1]]
             try:
                 link_urls, img_urls = self._extract_urls(
-                    docs_transformed.page_content, source
+                    docs_transformed.page_content, source, is_markdown=True
                 )
             except Exception:
                 link_urls, img_urls = "", ""
 
-            chunk_size = self.chunk_size
-            chunk_size = min(chunk_size - 500, int(chunk_size * 0.8))
-
-            if isinstance(docs_transformed, Document):
-                chunks = split_text_into_chunks(
-                    text=docs_transformed.page_content,
-                    chunk_size=chunk_size,
-                )
-            else:
-                chunks = split_text_into_chunks(
-                    text=docs_transformed, chunk_size=chunk_size
-                )
+        chunk_size = self.chunk_size
+        chunk_size = min(chunk_size - 500, int(chunk_size * 0.8))
 
-        state.update({self.output[0]: chunks})
-        state.update({"parsed_doc": chunks})
-        state.update({"content": chunks})
+        if isinstance(docs_transformed, Document):
+            chunks = split_text_into_chunks(
+                text=docs_transformed.page_content,
+                chunk_size=chunk_size,
+            )
+        else:
+            chunks = split_text_into_chunks(
+                text=docs_transformed, chunk_size=chunk_size
+            )
 
+        out = {self.output[0]: chunks, "parsed_doc": chunks, "content": chunks}
         if self.parse_urls:
-            state.update({self.output[1]: link_urls})
-            state.update({self.output[2]: img_urls})
+            out[self.output[1]] = link_urls
+            out[self.output[2]] = img_urls
+        state.update(out)
 
         return state
 
-    def _extract_urls(self, text: str, source: str) -> Tuple[List[str], List[str]]:
-        """Return (links, images) detected in *text*.
+    def _extract_doc_urls(self, raw_docs, source: str) -> Tuple[List[str], List[str]]:
+        """
+        Runs URL extraction on *raw HTML* to keep <img> tags intact.
 
-        The strategy is:
-        1.  Parse the string as HTML with BeautifulSoup – this reliably finds
-            <a>, <img>, <source>, etc. and their *href* / *src* / *data-src*.
-        2.  Run a regex pass to catch any http(s) links that are present in
-            markdown or plain text.
-        3.  Run a regex pass for the markdown relative-link syntax `](path)` so
-            we don't miss images that were converted to markdown by html2text.
-        4.  Normalise every URL – convert relative paths to absolute using the
-            original *source* page, strip whitespace, drop empty and hash-only
-            anchors, and split off query-strings when checking the extension.
+        html2text can strip/remove image elements, which prevents us from ever
+        seeing those URLs later.  Using the untouched HTML guarantees every
+        <img>/<a> reference is available.  Handles both single-Document and
+        list-of-Document input; lists are parsed one document at a time rather
+        than as one joined string, concurrently when there are enough of them.
         """
+        if not isinstance(raw_docs, list):
+            return self._extract_urls(raw_docs.page_content, source, is_markdown=False)
 
-        if not self.parse_urls:
-            return [], []
+        def extract(doc, _extract_urls=self._extract_urls):
+            return _extract_urls(doc.page_content, source, is_markdown=False)
 
-        image_exts = default_filters.filter_dict["img_exts"]
+        workers = min(len(raw_docs), os.cpu_count() or 1)
+        if len(raw_docs) > _PARALLEL_PARSE_MIN_DOCS and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() keeps document order, so first-seen URL order holds
+                results = list(pool.map(extract, raw_docs))
+        else:
+            results = map(extract, raw_docs)
 
-        links: set[str] = set()
-        images: set[str] = set()
+        link_dict, img_dict = {}, {}
+        for doc_links, doc_imgs in results:
+            link_dict.update(dict.fromkeys(doc_links))
+            img_dict.update(dict.fromkeys(doc_imgs))
+        if self.sort_urls:
+            return sorted(link_dict), sorted(img_dict)
+        return list(link_dict), list(img_dict)
 
-        def _categorise(url: str):
-            url = url.strip()
-            if not url or url in {"#", "/"}:
-                return
+    def _chunk_html(self, raw_docs) -> List[str]:
+        """
+        Converts HTML → markdown/plain-text and splits it into chunks, so that
+        the LLM gets cleaner text.
 
-            # Make absolute if needed
-            if not urlparse(url).scheme:
-                url_abs = urljoin(source, url)
-            else:
-                url_abs = url
+        Callers that only need the URLs can skip html2text entirely.  Only the
+        first document is chunked, so only it is converted.
+        """
+        first_doc = raw_docs[0] if isinstance(raw_docs, list) else raw_docs
+        if self.skip_html2text:
+            docs_transformed = first_doc
+        else:
+            docs_transformed = _html2text_transformer().transform_documents(
+                [first_doc]
+            )[0]
 
-            # Decide image vs link
-            url_no_query = url_abs.split("?", 1)[0].split("#", 1)[0]
-            if any(url_no_query.lower().endswith(ext) for ext in image_exts):
-                images.add(url_abs)
-            else:
-                links.add(url_abs)
+        return split_text_into_chunks(
+            text=docs_transformed.page_content,
+            chunk_size=self.chunk_size - 250,
+        )
 
-        # 1. BeautifulSoup on HTML content (may gracefully handle plain text)
-        try:
-            soup = BeautifulSoup(text, "html.parser")
-
-            # <a href>
-            for a in soup.find_all("a", href=True):
-                _categorise(a["href"])
-
-            # <img src> + common lazy-loading attributes
-            for tag in soup.find_all(["img", "source"]):
-                for attr in ("src", "data-src", "data-srcset", "srcset"):
-                    if tag.has_attr(attr):
-                        raw = tag[attr]
-                        # srcset can hold multiple URLs
-                        parts = [p.split()[0] for p in raw.split(",")] if attr.endswith("set") else [raw]
-                        for part in parts:
-                            _categorise(part)
-        except Exception as e:
-            if self.verbose:
-                self.logger.warning(f"BeautifulSoup parsing failed in _extract_urls: {e}")
-
-        # 2. Regex pass for absolute http(s) URLs in markdown/plain-text
-        abs_url_re = re.compile(r"https?://[^\s)\"'<>]+", re.I)
-        for match in abs_url_re.findall(text):
-            _categorise(match)
-
-        # 3. Regex pass for markdown relative links/images: ![alt](path) or [txt](path)
-        md_rel_re = re.compile(r"\]\(([^)]+)\)")
-        for match in md_rel_re.findall(text):
-            # Ignore titles inside the same parens – take only the first token
-            _categorise(match.split()[0])
+    def _extract_urls(
+        self, text: str, source: str, is_markdown: bool = True
+    ) -> Tuple[List[str], List[str]]:
+        """Return (links, images) detected in *text*.
 
-        # Remove duplicates and ensure deterministic order for reproducibility
-        final_links = sorted(links - images)
-        final_images = sorted(images)
+        See `_extract_urls_cached` for the extraction strategy; pass
+        ``is_markdown=False`` for raw HTML to skip the markdown-link pass.
+        """
+
+        if not self.parse_urls:
+            return [], []
+
+        final_links, final_images = _extract_urls_cached(
+            text, source, self.verbose, self.sort_urls, is_markdown
+        )
 
         if self.verbose:
             self.logger.info(
                 f"Extracted {len(final_links)} links and {len(final_images)} images from page"
             )
 
-        return final_links, final_images
+        return list(final_links), list(final_images)
 
     def _clean_urls(self, urls: List[str]) -> List[str]:
         """
@@ -237,18 +571,17 @@ class ParseNode(BaseNode):
 
         Returns:
             List[str]: The cleaned URLs.
+
+        Example:
+            >>> node = ParseNode("document", ["parsed_doc"], {"chunk_size": 1000})
+            >>> node._clean_urls(["[![img](a.png)](https://x.com)"])
+            ['https://x.com']
         """
         cleaned_urls = []
         for url in urls:
             if not ParseNode._is_valid_url(url):
-                url = re.sub(r".*?\]\(", "", url)
-                url = re.sub(r".*?\[\(", "", url)
-                url = re.sub(r".*?\[\)", "", url)
-                url = re.sub(r".*?\]\)", "", url)
-                url = re.sub(r".*?\)\[", "", url)
-                url = re.sub(r".*?\)\[", "", url)
-                url = re.sub(r".*?\(\]", "", url)
-                url = re.sub(r".*?\)\]", "", url)
+                for junk_re in _CLEAN_JUNK_RES:
+                    url = junk_re.sub("", url)
             url = url.rstrip(").-")
             if len(url) > 0:
                 cleaned_urls.append(url)
@@ -266,6 +599,6 @@ class ParseNode(BaseNode):
         Returns:
             bool: True if the URL format is valid, False otherwise
         """
-        if re.fullmatch(ParseNode.url_pattern, url) is not None:
+        if ParseNode.url_pattern.fullmatch(url) is not None:
             return True
         return False
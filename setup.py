@@ -64,6 +64,10 @@ setup(
             "sphinx-rtd-theme>=1.0",
             "myst-parser>=0.15",
         ],
+        "speedups": [
+            "selectolax>=0.3.17",
+            "google-re2>=1.1",
+        ],
     },
     entry_points={
         "console_scripts": [
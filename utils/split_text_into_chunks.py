@@ -2,9 +2,14 @@
 split_text_into_chunks module
 """
 
+from bisect import bisect_right
+from itertools import accumulate
 from typing import List
 
 from .tokenizer import num_tokens_calculus
+from .tokenizers.tokenizer_openai import get_openai_encoding
+
+_SPACE_BYTES = b" \t\n\r\f\v"
 
 
 def split_text_into_chunks(text: str, chunk_size: int, use_semchunk=True) -> List[str]:
@@ -33,27 +38,71 @@ def split_text_into_chunks(text: str, chunk_size: int, use_semchunk=True) -> Lis
         return chunks
 
     else:
-        tokens = num_tokens_calculus(text)
+        # Tokenize once so the whole document crosses into tiktoken a single
+        # time instead of once per word.
+        encoding = get_openai_encoding()
+        tokens = encoding.encode_ordinary(text)
+
+        # Callers derive sizes like chunk_size - 500, which can reach zero or
+        # below for small configs; every chunk must hold at least one token.
+        chunk_size = max(chunk_size, 1)
 
-        if tokens <= chunk_size:
+        if len(tokens) <= chunk_size:
             return [text]
 
+        # The encoding is byte-level BPE, so one character can span several
+        # tokens; decoding raw token slices would put U+FFFD at chunk edges.
+        # Instead, cut the UTF-8 text at token byte offsets, moved back to a
+        # word boundary (or at least a character boundary), and slice there.
+        token_bytes = encoding.decode_tokens_bytes(tokens)
+        data = b"".join(token_bytes)
+        starts = [0, *accumulate(map(len, token_bytes))]
+
         chunks = []
-        current_chunk = []
-        current_length = 0
-
-        words = text.split()
-        for word in words:
-            word_tokens = num_tokens_calculus(word)
-            if current_length + word_tokens > chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = word_tokens
+        lo = 0
+        while lo < len(data):
+            first = bisect_right(starts, lo) - 1
+            end = first + chunk_size
+            if end >= len(tokens):
+                hi = len(data)
             else:
-                current_chunk.append(word)
-                current_length += word_tokens
+                hi = _snap_cut(data, starts, lo, first, end)
 
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+            chunk = data[lo:hi].decode("utf-8").strip()
+            if chunk:
+                chunks.append(chunk)
+            lo = hi
 
         return chunks
+
+
+def _snap_cut(data: bytes, starts: List[int], lo: int, first: int, end: int) -> int:
+    """
+    Picks the byte offset ending a chunk that starts at *lo* in token *first*
+    and may extend up to (not including) token *end*.
+
+    Prefers the start of the last token that begins with whitespace, so words
+    stay whole; otherwise backs off to the start of a UTF-8 character.
+    """
+    for j in range(end, first, -1):
+        if starts[j] > lo and data[starts[j]] in _SPACE_BYTES:
+            return starts[j]
+
+    hi = starts[end]
+    while hi > lo and _is_continuation_byte(data[hi]):
+        hi -= 1
+    if hi > lo:
+        return hi
+
+    # A single character wider than the chunk: keep it whole in this chunk
+    hi = starts[end]
+    while hi < len(data) and _is_continuation_byte(data[hi]):
+        hi += 1
+    return hi
+
+
+def _is_continuation_byte(byte: int) -> bool:
+    """
+    Returns True for a UTF-8 continuation byte (0b10xxxxxx).
+    """
+    return 0x80 <= byte < 0xC0
@@ -2,11 +2,24 @@
 Tokenization utilities for OpenAI models
 """
 
+from functools import lru_cache
+
 import tiktoken
 
 from ..logging import get_logger
 
 
+@lru_cache(maxsize=None)
+def get_openai_encoding() -> tiktoken.Encoding:
+    """
+    Returns the tiktoken encoding used for OpenAI token counts, loaded once.
+
+    Returns:
+        tiktoken.Encoding: The encoding for the gpt-4o model family.
+    """
+    return tiktoken.encoding_for_model("gpt-4o")
+
+
 def num_tokens_openai(text: str) -> int:
     """
     Estimate the number of tokens in a given text using OpenAI's tokenization method,
@@ -23,7 +36,7 @@ def num_tokens_openai(text: str) -> int:
 
     logger.debug(f"Counting tokens for text of {len(text)} characters")
 
-    encoding = tiktoken.encoding_for_model("gpt-4o")
+    encoding = get_openai_encoding()
 
     num_tokens = len(encoding.encode(text))
     return num_tokens